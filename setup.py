@@ -9,6 +9,7 @@ setup(
         "pandas>=1.5.0",
         "numpy>=1.24.0",
         "openpyxl>=3.0.0",
+        "xlsxwriter>=3.0.0",
     ],
     python_requires=">=3.8",
     author="Your Name",
@@ -2,9 +2,51 @@
 Stock Analysis Package for financial data processing and analysis.
 """
 
-from .analyzer import StockAnalyzer
-from .data_loader import FinancialDataLoader
-from .calculator import FinancialCalculator
+import importlib
+import logging
+import os
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .analyzer import StockAnalyzer
+    from .data_loader import FinancialDataLoader
+    from .calculator import FinancialCalculator
+    from .results import AnalysisResult
 
 __version__ = "1.0.0"
-__all__ = ["StockAnalyzer", "FinancialDataLoader", "FinancialCalculator"]
+__all__ = ["StockAnalyzer", "FinancialDataLoader", "FinancialCalculator", "AnalysisResult"]
+
+# Submodule defining each public name; they pull in pandas, numpy and the Excel
+# libraries, so they are imported on first access rather than with the package
+_EXPORTS = {
+    "StockAnalyzer": ".analyzer",
+    "FinancialDataLoader": ".data_loader",
+    "FinancialCalculator": ".calculator",
+    "AnalysisResult": ".results",
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_EXPORTS))
+
+
+# Progress messages go to stdout alongside the printed reports;
+# set STOCK_ANALYSIS_LOG_LEVEL=WARNING to silence them in batch or CI runs
+_logger = logging.getLogger(__name__)
+# Applications (and pytest) that configure logging already receive the records
+# through the root logger; only print them directly when nothing else would
+if not logging.getLogger().handlers:
+    _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    _logger.addHandler(_handler)
+_level = getattr(logging, os.environ.get("STOCK_ANALYSIS_LOG_LEVEL", "INFO").upper(), None)
+_logger.setLevel(_level if isinstance(_level, int) else logging.INFO)
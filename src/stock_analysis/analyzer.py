@@ -2,11 +2,75 @@
 Main analyzer class that orchestrates the stock analysis process.
 """
 
-import pandas as pd
-from typing import Dict, Any, Optional
+import logging
+import math
+import os
+import numpy as np
+import xlsxwriter
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property
+from itertools import repeat
+from operator import attrgetter
+from typing import Dict, List, Mapping, Optional, Tuple
 from pathlib import Path
 from .data_loader import FinancialDataLoader
 from .calculator import FinancialCalculator
+from .results import AnalysisPeriod, AnalysisResult, MetricGrowth, Ratios, Values
+
+
+logger = logging.getLogger(__name__)
+
+
+# Metrics read from each statement by analyze_stock, in the column order it indexes them
+ANALYSIS_METRICS = {
+    'income': ['Revenue', 'Net Income', 'EPS (Basic)', 'Gross Profit'],
+    'balance_sheet': ['Total Debt', 'Cash & Equivalents'],
+    'cash_flow': ['Free Cash Flow Per Share'],
+    'ratios': ['PE Ratio', 'EPS Growth', 'Market Capitalization'],
+}
+
+# Metrics a start/end year must have, by statement
+YEAR_SEARCH_METRICS = {
+    'income': ['Revenue', 'Net Income'],
+    'cash_flow': ['Free Cash Flow'],
+}
+
+# Statements the analysis reads; other entries in a sheet mapping are not loaded
+REQUIRED_SHEETS = frozenset(ANALYSIS_METRICS)
+
+# Metric rows loaded from each statement; all other rows are skipped while reading
+LOADED_METRICS = {
+    data_type: frozenset(metrics) | frozenset(YEAR_SEARCH_METRICS.get(data_type, []))
+    for data_type, metrics in ANALYSIS_METRICS.items()
+}
+
+# Numeric columns of the Excel export as (header, results section, field, is percentage), in order
+EXPORT_FIELDS = [
+    ('Revenue (Start)', 'revenue', 'start_value', False),
+    ('Revenue (End)', 'revenue', 'end_value', False),
+    ('Revenue Growth', 'revenue', 'growth_rate', True),
+    ('Income (Start)', 'net_income', 'start_value', False),
+    ('Income (End)', 'net_income', 'end_value', False),
+    ('Income Growth', 'net_income', 'growth_rate', True),
+    ('FCF (Start)', 'free_cash_flow_per_share', 'start_value', False),
+    ('FCF (End)', 'free_cash_flow_per_share', 'end_value', False),
+    ('FCF Growth', 'free_cash_flow_per_share', 'growth_rate', True),
+    ('PE Ratio', 'ratios', 'pe_ratio', False),
+    ('PEG Ratio', 'ratios', 'peg_ratio', False),
+    ('Market Cap', 'values', 'market_cap', False),
+    ('Total Debt', 'values', 'total_debt', False),
+    ('Cash & Equivalents', 'values', 'cash_and_equivalents', False),
+    ('Enterprise Value', 'values', 'enterprise_value', False),
+    ('Gross Profit', 'values', 'gross_profit', False),
+]
+EXPORT_HEADERS = ['Ticker', 'Start Year', *(header for header, _, _, _ in EXPORT_FIELDS)]
+# Pulls every export field of a result as one tuple, in header order
+EXPORT_GETTER = attrgetter(*(f"{section}.{field}" for _, section, field, _ in EXPORT_FIELDS))
+EXPORT_CURRENCY_COLUMNS = [i for i, (_, _, _, is_pct) in enumerate(EXPORT_FIELDS) if not is_pct]
+EXPORT_PERCENTAGE_COLUMNS = [i for i, (_, _, _, is_pct) in enumerate(EXPORT_FIELDS) if is_pct]
+
+_format_currency = np.vectorize('${:,.2f}'.format, otypes=[object])
+_format_percent = np.vectorize('{:.2f}%'.format, otypes=[object])
 
 
 class StockAnalyzer:
@@ -20,10 +84,12 @@ class StockAnalyzer:
             data_directory: Path to directory containing Excel files
         """
         self.data_directory = Path(data_directory)
+        self._data_dir_str = os.fspath(self.data_directory)
         self.data_loader = FinancialDataLoader(data_directory)
         self.calculator = None
-        self.results = {}
+        self.results: Optional[AnalysisResult] = None
         self.ticker = None
+        self._complete_years = frozenset()
     
     def find_ticker_file(self, ticker: str) -> Optional[str]:
         """
@@ -35,19 +101,32 @@ class StockAnalyzer:
         Returns:
             Filename if found, None otherwise
         """
-        # Look for files with pattern: ticker-financials.xlsx
-        possible_files = [
-            f"{ticker.lower()}-financials.xlsx",
-            f"{ticker.upper()}-financials.xlsx",
-            f"{ticker}-financials.xlsx"
-        ]
-        
-        for filename in possible_files:
-            file_path = self.data_directory / filename
-            if file_path.exists():
-                return filename
-        
-        return None
+        filename = self._ticker_filename(ticker)
+        found = self._file_index.get(filename)
+        if found is None:
+            # The file may have been added since the directory was listed; rescan once
+            self.__dict__.pop('_file_index', None)
+            found = self._file_index.get(filename)
+        return found
+    
+    @staticmethod
+    def _ticker_filename(ticker: str) -> str:
+        """Key of a ticker's file in _file_index."""
+        # Look for files with pattern: ticker-financials.xlsx (case-insensitive)
+        return f"{ticker.lower()}-financials.xlsx"
+    
+    @cached_property
+    def _file_index(self) -> Dict[str, str]:
+        """Map lowercased financials filenames to their names on disk, read in one directory pass."""
+        try:
+            with os.scandir(self._data_dir_str) as entries:
+                return {
+                    entry.name.lower(): entry.name
+                    for entry in entries
+                    if entry.name.lower().endswith('-financials.xlsx')
+                }
+        except FileNotFoundError:
+            return {}
     
     def load_data(self, ticker: str, sheet_mapping: Dict[str, str]) -> None:
         """
@@ -55,23 +134,32 @@ class StockAnalyzer:
         
         Args:
             ticker: Stock ticker symbol
-            sheet_mapping: Dictionary mapping data types to sheet names
+            sheet_mapping: Dictionary mapping data types to sheet names; only the
+                statements and metric rows used by the analysis are loaded
         """
+        # Forget the previous ticker's results so a failed load can't leave them behind
+        self.results = None
         self.ticker = ticker.upper()
         excel_file = self.find_ticker_file(ticker)
         
         if excel_file is None:
             raise FileNotFoundError(f"No financial data file found for ticker {ticker}")
         
-        print(f"Found data file: {excel_file}")
-        data = self.data_loader.load_financial_data(sheet_mapping, excel_file)
+        logger.info(f"Found data file: {excel_file}")
+        effective_mapping = {
+            data_type: sheet_name for data_type, sheet_name in sheet_mapping.items()
+            if data_type in REQUIRED_SHEETS
+        }
+        data = self.data_loader.load_financial_data(effective_mapping, excel_file, LOADED_METRICS)
         self.calculator = FinancialCalculator(data)
+        
+        # Years with every metric the start/end year searches require, found in one pass
+        self._complete_years = frozenset(self._years_with_all_metrics(self.calculator.income_years))
     
-    def find_best_start_year(self, preferred_years: list = None) -> str:
+    def find_best_start_year(self, preferred_years: list = None) -> int:
         """
         Find the best available start year based on data availability.
         Ensures the start year has all required metrics: Revenue, Income, and FCF.
-        Searches by year (2019, 2020, 2021, etc.) regardless of month/day.
         
         Args:
             preferred_years: List of preferred years in order of preference
@@ -82,106 +170,61 @@ class StockAnalyzer:
         if preferred_years is None:
             preferred_years = [2019, 2020, 2021, 2022, 2023, 2024]
         
-        def find_date_for_year(year: int) -> str:
-            """Find any date entry for the given year in the data."""
-            if self.calculator.income_data is not None:
-                available_dates = self.calculator.income_data.index.strftime('%Y-%m-%d')
-                for date in available_dates:
-                    if date.startswith(str(year)):
-                        return date
-            return None
-        
         # Check data availability for each preferred year
         for year in preferred_years:
-            date_for_year = find_date_for_year(year)
-            
-            if date_for_year:
-                revenue_value = self.calculator.get_metric_value(date_for_year, 'income', 'Revenue')
-                income_value = self.calculator.get_metric_value(date_for_year, 'income', 'Net Income')
-                fcf_value = self.calculator.get_metric_value(date_for_year, 'cash_flow', 'Free Cash Flow')
-                
-                # Check if all three required values are available
-                if (revenue_value != 'N/A' and revenue_value is not None and
-                    income_value != 'N/A' and income_value is not None and
-                    fcf_value != 'N/A' and fcf_value is not None):
-                    print(f"Using start year: {year} (date: {date_for_year})")
-                    return date_for_year
+            if year in self._complete_years:
+                logger.info(f"Using start year: {year}")
+                return year
         
         # If no preferred year works, find the earliest available year from 2019 onwards
-        # that has all three required metrics
-        if self.calculator.income_data is not None:
-            available_dates = sorted(self.calculator.income_data.index.strftime('%Y-%m-%d'))
-            
-            for date in available_dates:
-                year = int(date[:4])
-                
-                # Skip years before 2019 and after 2024
-                if year < 2019 or year > 2024:
-                    continue
-                    
-                revenue_value = self.calculator.get_metric_value(date, 'income', 'Revenue')
-                income_value = self.calculator.get_metric_value(date, 'income', 'Net Income')
-                fcf_value = self.calculator.get_metric_value(date, 'cash_flow', 'Free Cash Flow')
-                
-                # Check if all three required values are available
-                if (revenue_value != 'N/A' and revenue_value is not None and
-                    income_value != 'N/A' and income_value is not None and
-                    fcf_value != 'N/A' and fcf_value is not None):
-                    print(f"Using earliest available year with all metrics: {year} (date: {date})")
-                    return date
-        
-        # Default fallback - try to find any 2019 date, or create one
-        fallback_date = find_date_for_year(2019)
-        if fallback_date:
-            print(f"Warning: No year found with all required metrics. Using fallback: {fallback_date}")
-            return fallback_date
-        
-        # Absolute fallback
-        print("Warning: No suitable date found. Using default 2019-12-31")
-        return "2019-12-31"
+        # that has all three required metrics (years before 2019 and after 2024 are skipped)
+        year = min((year for year in self._complete_years if 2019 <= year <= 2024), default=None)
+        if year is not None:
+            logger.info(f"Using earliest available year with all metrics: {year}")
+            return year
+        
+        # Fallback - default to 2019
+        logger.warning("Warning: No year found with all required metrics. Using default 2019")
+        return 2019
 
-    def find_best_end_year(self) -> str:
+    def find_best_end_year(self) -> int:
         """
         Find the best available end year from 2024 based on data availability.
         Ensures the end year has all required metrics: Revenue, Income, and FCF.
         
         Returns:
-            Best available end year date from 2024
+            Best available end year (2024)
         """
 
-        end_year = '2024'
-        
-        def has_all_metrics(date: str) -> bool:
-            """Check if a date has all three required metrics."""
-            revenue_value = self.calculator.get_metric_value(date, 'income', 'Revenue')
-            income_value = self.calculator.get_metric_value(date, 'income', 'Net Income')
-            fcf_value = self.calculator.get_metric_value(date, 'cash_flow', 'Free Cash Flow')
-            
-            return (revenue_value != 'N/A' and revenue_value is not None and
-                    income_value != 'N/A' and income_value is not None and
-                    fcf_value != 'N/A' and fcf_value is not None)
+        end_year = 2024
         
-        # Find all available end_year dates
-        if self.calculator.income_data is not None:
-            available_dates = sorted(self.calculator.income_data.index.strftime('%Y-%m-%d'))
-            
-            # Look for end_year dates with all required metrics
-            for date in reversed(available_dates):  # Start from latest date
-                if date.startswith(end_year) and has_all_metrics(date):
-                    print(f"Using end year: 2024 (date: {date})")
-                    return date
-            
-            # If no end_year date has all metrics, just pick any end_year date
-            for date in reversed(available_dates):
-                if date.startswith(end_year):
-                    print(f"Warning: Using {end_year} date without all metrics: {date}")
-                    return date
+        if end_year in self.calculator.income_year_set:
+            if end_year in self._complete_years:
+                logger.info(f"Using end year: {end_year}")
+            else:
+                logger.warning(f"Warning: Using {end_year} without all metrics")
+            return end_year
         
         # Fallback if no end_year data exists
-        print(f"Warning: No {end_year} data found. Using default {end_year}-12-31")
-        return f"{end_year}-12-31"
+        logger.warning(f"Warning: No {end_year} data found. Using default {end_year}")
+        return end_year
     
-    def analyze_stock(self) -> Dict[str, Any]:
+    def _years_with_all_metrics(self, years: list) -> list:
+        """
+        Filter years down to those with all required metrics: Revenue, Income, and FCF.
+        
+        Args:
+            years: Candidate years
+            
+        Returns:
+            The candidate years that have every required metric, in the given order
+        """
+        income = self.calculator.get_metrics_block(years, 'income', YEAR_SEARCH_METRICS['income'])
+        cash_flow = self.calculator.get_metrics_block(years, 'cash_flow', YEAR_SEARCH_METRICS['cash_flow'])
+        complete = np.isfinite(income).all(axis=1) & np.isfinite(cash_flow[:, 0])
+        return [year for year, is_complete in zip(years, complete) if is_complete]
+    
+    def analyze_stock(self) -> AnalysisResult:
         """
         Perform comprehensive stock analysis.
         
@@ -189,7 +232,7 @@ class StockAnalyzer:
             end_year: Ending year for analysis
             
         Returns:
-            Dictionary containing analysis results
+            AnalysisResult with the analysis of the loaded ticker
         """
         if self.calculator is None:
             raise ValueError("Data must be loaded first using load_data()")
@@ -198,81 +241,59 @@ class StockAnalyzer:
         start_year = self.find_best_start_year()
         end_year = self.find_best_end_year()
         
+        # Pull every metric for both years with one lookup per statement
+        years = [start_year, end_year]
+        blocks = {
+            data_type: self.calculator.get_metrics_block(years, data_type, metrics)
+            for data_type, metrics in ANALYSIS_METRICS.items()
+        }
+        income, cash_flow = blocks['income'], blocks['cash_flow']
+        balance_sheet, ratios = blocks['balance_sheet'], blocks['ratios']
+        income_growth = self.calculator.calculate_growth_rates(income[0], income[1])
+        cash_flow_growth = self.calculator.calculate_growth_rates(cash_flow[0], cash_flow[1])
+        value = self.calculator.to_metric_value
+        
         # Revenue analysis
-        revenue_start = self.calculator.get_metric_value(start_year, 'income', 'Revenue')
-        revenue_end = self.calculator.get_metric_value(end_year, 'income', 'Revenue')
-        revenue_growth = self.calculator.calculate_growth_rate(start_year, end_year, 'income', 'Revenue')
+        revenue_start = value(income[0, 0])
+        revenue_end = value(income[1, 0])
+        revenue_growth = value(income_growth[0])
         
         # Net Income analysis
-        net_income_start = self.calculator.get_metric_value(start_year, 'income', 'Net Income')
-        net_income_end = self.calculator.get_metric_value(end_year, 'income', 'Net Income')
-        net_income_growth = self.calculator.calculate_growth_rate(start_year, end_year, 'income', 'Net Income')
+        net_income_start = value(income[0, 1])
+        net_income_end = value(income[1, 1])
+        net_income_growth = value(income_growth[1])
         
         # Free Cash Flow per Share analysis
-        fcf_start = self.calculator.get_metric_value(start_year, 'cash_flow', 'Free Cash Flow Per Share')
-        fcf_end = self.calculator.get_metric_value(end_year, 'cash_flow', 'Free Cash Flow Per Share')
-        fcf_growth = self.calculator.calculate_growth_rate(start_year, end_year, 'cash_flow', 'Free Cash Flow Per Share')
+        fcf_start = value(cash_flow[0, 0])
+        fcf_end = value(cash_flow[1, 0])
+        fcf_growth = value(cash_flow_growth[0])
         
-        # Ratios
-        pe_ratio = self.calculator.get_metric_value(end_year, 'ratios', 'PE Ratio')
-        
-        #EPS Growth
-        eps_growth_direct = self.calculator.get_metric_value(end_year, 'ratios', 'EPS Growth')
-        eps_basic_start = self.calculator.get_metric_value(start_year, 'income', 'EPS (Basic)')
-        eps_basic_end = self.calculator.get_metric_value(end_year, 'income', 'EPS (Basic)')
-        eps_growth_calculated = self.calculator.calculate_growth_rate(start_year, end_year, 'income', 'EPS (Basic)')
-
-        
-        # Calculate PEG ratio
-        if pe_ratio != 'N/A' and eps_growth_direct != 'N/A' and eps_growth_direct != 0:
-            peg_ratio = pe_ratio / eps_growth_direct
-        elif pe_ratio != 'N/A' and eps_growth_calculated != 'N/A' and eps_growth_calculated != 0:
-            peg_ratio = pe_ratio / eps_growth_calculated
-        else:
-            peg_ratio = 'N/A'
+        # Ratios, with PEG from the reported EPS growth or else the calculated one
+        pe_ratio = value(ratios[1, 0])
+        peg_ratio = value(self.calculator.calculate_peg_ratios(ratios[1, 0], ratios[1, 1], income_growth[2]))
         
         # Enterprise Value and Gross Profit
-        market_cap = self.calculator.get_metric_value(end_year, 'ratios', 'Market Capitalization')
-        total_debt = self.calculator.get_metric_value(end_year, 'balance_sheet', 'Total Debt')
-        cash_and_equivalents = self.calculator.get_metric_value(end_year, 'balance_sheet', 'Cash & Equivalents')
-        enterprise_value = self.calculator.calculate_enterprise_value(end_year)
-        gross_profit = self.calculator.get_metric_value(end_year, 'income', 'Gross Profit')
-        
-        self.results = {
-            'ticker': self.ticker,
-            'analysis_period': {
-                'start_year': start_year,
-                'end_year': end_year
-            },
-            'revenue': {
-                'start_value': revenue_start,
-                'end_value': revenue_end,
-                'growth_rate': revenue_growth
-            },
-            'net_income': {
-                'start_value': net_income_start,
-                'end_value': net_income_end,
-                'growth_rate': net_income_growth
-            },
-            'free_cash_flow_per_share': {
-                'start_value': fcf_start,
-                'end_value': fcf_end,
-                'growth_rate': fcf_growth
-            },
-            'ratios': {
-                'pe_ratio': pe_ratio,
-                'peg_ratio': peg_ratio
-            },
-            'values': {
-                'market_cap': market_cap,
-                'total_debt': total_debt,
-                'cash_and_equivalents': cash_and_equivalents,
-                'enterprise_value': enterprise_value,
-                'gross_profit': gross_profit
-            }
-        }
-        
-        return self.results
+        market_cap = value(ratios[1, 2])
+        total_debt = value(balance_sheet[1, 0])
+        cash_and_equivalents = value(balance_sheet[1, 1])
+        enterprise_value = value(self.calculator.calculate_enterprise_values(
+            ratios[1, 2], balance_sheet[1, 0], balance_sheet[1, 1]
+        ))
+        gross_profit = value(income[1, 3])
+        
+        # Build a fresh result per analysis so earlier results can be kept without copying
+        result = AnalysisResult(
+            ticker=self.ticker,
+            analysis_period=AnalysisPeriod(start_year, end_year),
+            revenue=MetricGrowth(revenue_start, revenue_end, revenue_growth),
+            net_income=MetricGrowth(net_income_start, net_income_end, net_income_growth),
+            free_cash_flow_per_share=MetricGrowth(fcf_start, fcf_end, fcf_growth),
+            ratios=Ratios(pe_ratio, peg_ratio),
+            values=Values(market_cap, total_debt, cash_and_equivalents, enterprise_value, gross_profit)
+        )
+        
+        self.results = result
+        return result
     
     def export_to_excel(self, output_filename: str = None, batch_results: list = None) -> None:
         """
@@ -302,155 +323,186 @@ class StockAnalyzer:
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Prepare data for Excel export
-        data_rows = []
-        
-        # Define column headers
-        headers = [
-            'Ticker', 'Start Year', 'Revenue (Start)', 'Revenue (End)', 'Revenue Growth',
-            'Income (Start)', 'Income (End)', 'Income Growth', 'FCF (Start)', 'FCF (End)',
-            'FCF Growth', 'PE Ratio', 'PEG Ratio', 'Market Cap', 'Total Debt',
-            'Cash & Equivalents', 'Enterprise Value', 'Gross Profit'
-        ]
-        
-        # Process each ticker result
-        for result in results_to_process:
-            if not result:  # Skip empty results
-                continue
-                
-            row_data = []
-            
-            # Basic info
-            row_data.append(result['ticker'])
-            row_data.append(result['analysis_period']['start_year'])
-            
-            # Revenue metrics
-            rev = result['revenue']
-            row_data.append(self._format_value(rev['start_value']))
-            row_data.append(self._format_value(rev['end_value']))
-            row_data.append(self._format_percentage(rev['growth_rate']))
-            
-            # Net Income metrics
-            ni = result['net_income']
-            row_data.append(self._format_value(ni['start_value']))
-            row_data.append(self._format_value(ni['end_value']))
-            row_data.append(self._format_percentage(ni['growth_rate']))
-            
-            # Free Cash Flow metrics
-            fcf = result['free_cash_flow_per_share']
-            row_data.append(self._format_value(fcf['start_value']))
-            row_data.append(self._format_value(fcf['end_value']))
-            row_data.append(self._format_percentage(fcf['growth_rate']))
-            
-            # Ratios
-            ratios = result['ratios']
-            row_data.append(self._format_value(ratios['pe_ratio']))
-            row_data.append(self._format_value(ratios['peg_ratio']))
-            
-            # Other metrics
-            values = result['values']
-            row_data.append(self._format_value(values['market_cap']))
-            row_data.append(self._format_value(values['total_debt']))
-            row_data.append(self._format_value(values['cash_and_equivalents']))
-            row_data.append(self._format_value(values['enterprise_value']))
-            row_data.append(self._format_value(values['gross_profit']))
-            
-            data_rows.append(row_data)
-        
-        # Create DataFrame and export
-        df = pd.DataFrame(data_rows, columns=headers)
-        
-        with pd.ExcelWriter(output_filename, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='Analysis Results', index=False)
-        
-        print(f"Analysis results exported to: {output_filename}")
+        results = [result for result in results_to_process if result]  # Skip empty results
+        
+        # Collect the raw numeric fields of every ticker into one float matrix
+        values = np.array([EXPORT_GETTER(result) for result in results], dtype=float)
+        values = values.reshape(len(results), len(EXPORT_FIELDS))
+        
+        # Format each column category in one pass, then mark missing values
+        formatted = np.empty(values.shape, dtype=object)
+        formatted[:, EXPORT_CURRENCY_COLUMNS] = _format_currency(values[:, EXPORT_CURRENCY_COLUMNS])
+        formatted[:, EXPORT_PERCENTAGE_COLUMNS] = _format_percent(values[:, EXPORT_PERCENTAGE_COLUMNS])
+        formatted[~np.isfinite(values)] = 'N/A'
+        
+        # Write header and rows straight to the sheet; rows go out in order,
+        # so xlsxwriter can stream them in constant_memory mode. Every cell is
+        # plain text, so skip the per-string URL and formula detection.
+        workbook = xlsxwriter.Workbook(output_filename, {
+            'constant_memory': True,
+            'strings_to_urls': False,
+            'strings_to_formulas': False,
+        })
+        try:
+            worksheet = workbook.add_worksheet('Analysis Results')
+            header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center'})
+            worksheet.write_row(0, 0, EXPORT_HEADERS, header_format)
+            for row_number, (result, row) in enumerate(zip(results, formatted), start=1):
+                worksheet.write_row(
+                    row_number, 0,
+                    [result.ticker, result.analysis_period.start_year, *row]
+                )
+        finally:
+            workbook.close()
+        
+        logger.info(f"Analysis results exported to: {output_filename}")
 
 
+    def analyze_tickers(self, tickers: list,
+                        sheet_mapping: Mapping[str, str]) -> List[Tuple[Optional[AnalysisResult], Optional[str]]]:
+        """
+        Load and analyze several tickers in parallel worker processes.
+        
+        Args:
+            tickers: List of ticker symbols
+            sheet_mapping: Mapping of data types to sheet names
+            
+        Returns:
+            One (results, None) or (None, error message) pair per ticker, in ticker order
+        """
+        # Resolve every data file from this analyzer's directory listing, so workers
+        # don't each rescan the data directory; files added since it was listed
+        # are picked up by at most one rescan for the whole batch
+        filenames = [self._ticker_filename(ticker) for ticker in tickers]
+        if any(filename not in self._file_index for filename in filenames):
+            self.__dict__.pop('_file_index', None)
+        excel_files = [self._file_index.get(filename) for filename in filenames]
+        
+        # Tickers without a file fail here instead of in a worker
+        results = [
+            (None, f"No financial data file found for ticker {ticker}") if excel_file is None else None
+            for ticker, excel_file in zip(tickers, excel_files)
+        ]
+        pending = [i for i, excel_file in enumerate(excel_files) if excel_file is not None]
+        if not pending:
+            return results
+        
+        # Workers receive a plain dict, since read-only mappings can't be pickled.
+        # Small batches don't start idle workers.
+        max_workers = min(len(pending), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            analyzed = executor.map(
+                _analyze_one, repeat(self._data_dir_str), [tickers[i] for i in pending],
+                repeat(dict(sheet_mapping)), [excel_files[i] for i in pending]
+            )
+            for i, result in zip(pending, analyzed):
+                results[i] = result
+        return results
+    
     # Example usage for batch processing:
-    def batch_analyze_and_export(self, tickers: list, output_filename: str = None) -> None:
+    def batch_analyze_and_export(self, tickers: list, output_filename: str = None, *,
+                                 sheet_mapping: Mapping[str, str]) -> None:
         """
-        Analyze multiple tickers and export results to Excel.
+        Analyze multiple tickers in parallel and export results to Excel.
         
         Args:
             tickers: List of ticker symbols
             output_filename: Output filename (optional)
+            sheet_mapping: Mapping of data types to sheet names (keyword-only)
         """
         batch_results = []
-        
-        for ticker in tickers:
-            try:
-                # Assuming you have a method to set ticker and analyze
-                original_ticker = self.ticker
-                self.ticker = ticker
-                self.analyze_stock()  # Your existing analyze method
-                batch_results.append(self.results.copy())
-                self.ticker = original_ticker
-            except Exception as e:
-                print(f"Error analyzing {ticker}: {e}")
-                batch_results.append(None)  # Add None for failed analysis
+        for ticker, (result, error) in zip(tickers, self.analyze_tickers(tickers, sheet_mapping)):
+            if error is not None:
+                logger.error(f"Error analyzing {ticker}: {error}")
+            batch_results.append(result)  # None for a failed analysis
         
         # Export all results
         self.export_to_excel(output_filename, batch_results)
     
     def _format_value(self, value):
-        """Format numeric values for display."""
-        if value == 'N/A' or value is None:
-            return 'N/A'
-        try:
-            return f"${value:,.2f}"
-        except:
-            return str(value)
+        """Format numeric values for display; missing (NaN) values show as 'N/A'."""
+        return f"${value:,.2f}" if isinstance(value, (int, float)) and math.isfinite(value) else 'N/A'
     
     def _format_percentage(self, value):
-        """Format percentage values for display."""
-        if value == 'N/A' or value is None:
-            return 'N/A'
-        try:
-            return f"{value:.2f}%"
-        except:
-            return str(value)
+        """Format percentage values for display; missing (NaN) values show as 'N/A'."""
+        return f"{value:.2f}%" if isinstance(value, (int, float)) and math.isfinite(value) else 'N/A'
     
-    def print_analysis(self) -> None:
-        """Print formatted analysis results."""
-        if not self.results:
+    def print_analysis(self, results: Optional[AnalysisResult] = None) -> None:
+        """
+        Print formatted analysis results.
+        
+        Args:
+            results: Results to print (optional); defaults to the last analysis
+        """
+        if results is None:
+            results = self.results
+        if not results:
             print("No analysis results available. Run analyze_stock() first.")
             return
         
-        print(f"Financial Analysis Results for {self.results['ticker']}:")
-        print(f"Analysis Period: {self.results['analysis_period']['start_year']} to {self.results['analysis_period']['end_year']}")
+        print(f"Financial Analysis Results for {results.ticker}:")
+        print(f"Analysis Period: {results.analysis_period.start_year} to {results.analysis_period.end_year}")
         print("=" * 60)
         
         # Revenue
-        rev = self.results['revenue']
-        print(f"Revenue (Start): {self._format_value(rev['start_value'])}")
-        print(f"Revenue (End): {self._format_value(rev['end_value'])}")
-        print(f"Revenue Growth: {self._format_percentage(rev['growth_rate'])}")
+        rev = results.revenue
+        print(f"Revenue (Start): {self._format_value(rev.start_value)}")
+        print(f"Revenue (End): {self._format_value(rev.end_value)}")
+        print(f"Revenue Growth: {self._format_percentage(rev.growth_rate)}")
         print("-" * 40)
         
         # Net Income
-        ni = self.results['net_income']
-        print(f"Net Income (Start): {self._format_value(ni['start_value'])}")
-        print(f"Net Income (End): {self._format_value(ni['end_value'])}")
-        print(f"Net Income Growth: {self._format_percentage(ni['growth_rate'])}")
+        ni = results.net_income
+        print(f"Net Income (Start): {self._format_value(ni.start_value)}")
+        print(f"Net Income (End): {self._format_value(ni.end_value)}")
+        print(f"Net Income Growth: {self._format_percentage(ni.growth_rate)}")
         print("-" * 40)
         
         # Free Cash Flow
-        fcf = self.results['free_cash_flow_per_share']
-        print(f"FCF per Share (Start): {self._format_value(fcf['start_value'])}")
-        print(f"FCF per Share (End): {self._format_value(fcf['end_value'])}")
-        print(f"FCF per Share Growth: {self._format_percentage(fcf['growth_rate'])}")
+        fcf = results.free_cash_flow_per_share
+        print(f"FCF per Share (Start): {self._format_value(fcf.start_value)}")
+        print(f"FCF per Share (End): {self._format_value(fcf.end_value)}")
+        print(f"FCF per Share Growth: {self._format_percentage(fcf.growth_rate)}")
         print("-" * 40)
         
         # Ratios
-        ratios = self.results['ratios']
-        print(f"PE Ratio: {self._format_value(ratios['pe_ratio'])}")
-        print(f"PEG Ratio: {self._format_value(ratios['peg_ratio'])}")
+        ratios = results.ratios
+        print(f"PE Ratio: {self._format_value(ratios.pe_ratio)}")
+        print(f"PEG Ratio: {self._format_value(ratios.peg_ratio)}")
         print("-" * 40)
         
         # Enterprise Value and Gross Profit
-        values = self.results['values']
-        print(f"Market Cap: {self._format_value(values['market_cap'])}")
-        print(f"Total Debt: {self._format_value(values['total_debt'])}")
-        print(f"Cash & Equivalents: {self._format_value(values['cash_and_equivalents'])}")
-        print(f"Enterprise Value: {self._format_value(values['enterprise_value'])}")
-        print(f"Gross Profit: {self._format_value(values['gross_profit'])}")
-        print("=" * 60)
\ No newline at end of file
+        values = results.values
+        print(f"Market Cap: {self._format_value(values.market_cap)}")
+        print(f"Total Debt: {self._format_value(values.total_debt)}")
+        print(f"Cash & Equivalents: {self._format_value(values.cash_and_equivalents)}")
+        print(f"Enterprise Value: {self._format_value(values.enterprise_value)}")
+        print(f"Gross Profit: {self._format_value(values.gross_profit)}")
+        print("=" * 60)
+
+
+def _analyze_one(data_directory: str, ticker: str, sheet_mapping: Dict[str, str],
+                 excel_file: Optional[str] = None) -> Tuple[Optional[AnalysisResult], Optional[str]]:
+    """
+    Load and analyze a single ticker with a fresh analyzer.
+    
+    Defined at module level so it can run in a worker process.
+    
+    Args:
+        data_directory: Path to directory containing Excel files
+        ticker: Stock ticker symbol
+        sheet_mapping: Dictionary mapping data types to sheet names
+        excel_file: Data file already resolved for the ticker (optional); when
+            given, the worker skips listing the data directory
+        
+    Returns:
+        (results, None) on success, or (None, error message) if the analysis failed
+    """
+    analyzer = StockAnalyzer(data_directory)
+    if excel_file is not None:
+        analyzer._file_index = {excel_file.lower(): excel_file}
+    try:
+        analyzer.load_data(ticker, sheet_mapping)
+        return analyzer.analyze_stock(), None
+    except Exception as e:
+        return None, str(e)
@@ -4,7 +4,7 @@ Module for financial calculations and metrics.
 
 import pandas as pd
 import numpy as np
-from typing import Union, Dict, Any
+from typing import Dict, Any, List
 
 
 class FinancialCalculator:
@@ -21,118 +21,166 @@ class FinancialCalculator:
         self.balance_sheet_data = data.get('balance_sheet')
         self.cash_flow_data = data.get('cash_flow')
         self.ratios_data = data.get('ratios')
+        
+        # Statements by data type, built once for every lookup
+        self._data_map = {
+            'income': self.income_data,
+            'balance_sheet': self.balance_sheet_data,
+            'cash_flow': self.cash_flow_data,
+            'ratios': self.ratios_data
+        }
+        
+        # Float64 copy of each statement, so batched lookups stay in NumPy
+        self._values = {
+            data_type: self._as_float_array(df) for data_type, df in self._data_map.items()
+        }
+        
+        # Years of each statement, sorted once; income years drive the start/end year searches
+        self._available_years = {
+            data_type: [] if df is None else sorted(df.index.tolist())
+            for data_type, df in self._data_map.items()
+        }
+        self.income_years: List[int] = self._available_years['income']
+        self.income_year_set = frozenset(self.income_years)
     
-    def calculate_growth_rate(self, start_year: str, end_year: str, 
-                            data_type: str, metric: str) -> Union[float, str]:
+    def calculate_growth_rate(self, start_year: int, end_year: int, 
+                            data_type: str, metric: str) -> float:
         """
         Calculate growth rate between two years for a specific metric.
         
         Args:
-            start_year: Starting year (e.g., '2019-12-31')
-            end_year: Ending year (e.g., '2024-12-31')
+            start_year: Starting fiscal year (e.g., 2019)
+            end_year: Ending fiscal year (e.g., 2024)
             data_type: Type of data ('income', 'balance_sheet', 'cash_flow', 'ratios')
             metric: Metric name to calculate growth for
             
         Returns:
-            Growth rate as percentage or 'N/A' if calculation not possible
+            Growth rate as percentage or NaN if calculation not possible
         """
-        data_map = {
-            'income': self.income_data,
-            'balance_sheet': self.balance_sheet_data,
-            'cash_flow': self.cash_flow_data,
-            'ratios': self.ratios_data
-        }
-        
-        df = data_map.get(data_type)
-        if df is None:
-            return 'N/A'
-        
-        try:
-            start_value = df.loc[start_year, metric]
-            end_value = df.loc[end_year, metric]
-            
-            # Check for invalid values
-            if (pd.isna(start_value) or pd.isna(end_value) or 
-                start_value == 0 or np.isinf(start_value) or np.isinf(end_value)):
-                return 'N/A'
-            
-            # Calculate growth rate
-            growth_rate = ((end_value - start_value) / abs(start_value)) * 100
-            
-            # Check if result is valid
-            if np.isnan(growth_rate) or np.isinf(growth_rate):
-                return 'N/A'
-            
-            return growth_rate
-            
-        except (KeyError, IndexError, TypeError):
-            return 'N/A'
+        # Both years come from one batched lookup
+        block = self.get_metrics_block([start_year, end_year], data_type, [metric])
+        return self.to_metric_value(self.calculate_growth_rates(block[0, 0], block[1, 0]))
     
-    def calculate_enterprise_value(self, year: str) -> Union[float, str]:
+    def calculate_enterprise_value(self, year: int) -> float:
         """
         Calculate Enterprise Value = Market Cap + Total Debt - Cash and Equivalents
         
         Args:
-            year: Year for calculation (e.g., '2024-12-31')
+            year: Fiscal year for calculation (e.g., 2024)
             
         Returns:
-            Enterprise value or 'N/A' if calculation not possible
+            Enterprise value or NaN if calculation not possible
         """
-        try:
-            market_cap = self.ratios_data.loc[year, 'Market Capitalization']
-            total_debt = self.balance_sheet_data.loc[year, 'Total Debt']
-            cash_and_equivalents = self.balance_sheet_data.loc[year, 'Cash & Equivalents']
-            
-            # Check for invalid values
-            if (pd.isna(market_cap) or pd.isna(total_debt) or pd.isna(cash_and_equivalents) or
-                np.isinf(market_cap) or np.isinf(total_debt) or np.isinf(cash_and_equivalents)):
-                return 'N/A'
-            
-            enterprise_value = market_cap + total_debt - cash_and_equivalents
-            
-            # Check if result is valid
-            if np.isnan(enterprise_value) or np.isinf(enterprise_value):
-                return 'N/A'
-            
-            return enterprise_value
-            
-        except (KeyError, IndexError, TypeError):
-            return 'N/A'
+        ratios = self.get_metrics_block([year], 'ratios', ['Market Capitalization'])
+        balance_sheet = self.get_metrics_block([year], 'balance_sheet', ['Total Debt', 'Cash & Equivalents'])
+        return self.to_metric_value(
+            self.calculate_enterprise_values(ratios[0, 0], balance_sheet[0, 0], balance_sheet[0, 1])
+        )
     
-    def get_metric_value(self, year: str, data_type: str, metric: str) -> Union[float, str]:
+    def get_metric_value(self, year: int, data_type: str, metric: str) -> float:
         """
         Get a specific metric value for a given year.
         
         Args:
-            year: Year (e.g., '2024-12-31')
+            year: Fiscal year (e.g., 2024)
             data_type: Type of data ('income', 'balance_sheet', 'cash_flow', 'ratios')
             metric: Metric name
             
         Returns:
-            Metric value or 'N/A' if not available
+            Metric value or NaN if not available
         """
-        data_map = {
-            'income': self.income_data,
-            'balance_sheet': self.balance_sheet_data,
-            'cash_flow': self.cash_flow_data,
-            'ratios': self.ratios_data
-        }
+        return self.to_metric_value(float(self.get_metrics_block([year], data_type, [metric])[0, 0]))
+    
+    def get_metrics_block(self, years: List[int], data_type: str, metrics: List[str]) -> np.ndarray:
+        """
+        Get several metrics for several years in a single lookup.
         
-        df = data_map.get(data_type)
+        Args:
+            years: Fiscal years (e.g., [2019, 2024])
+            data_type: Type of data ('income', 'balance_sheet', 'cash_flow', 'ratios')
+            metrics: Metric names
+            
+        Returns:
+            Float array of shape (len(years), len(metrics)); missing values are NaN
+        """
+        df = self._data_map.get(data_type)
         if df is None:
-            return 'N/A'
+            return np.full((len(years), len(metrics)), np.nan)
         
-        try:
-            value = df.loc[year, metric]
+        # Resolve labels to positions once, then gather every found cell in one take
+        rows = df.index.get_indexer(years)
+        cols = df.columns.get_indexer(metrics)
+        block = np.full((len(rows), len(cols)), np.nan)
+        found_rows, found_cols = np.nonzero((rows >= 0)[:, None] & (cols >= 0)[None, :])
+        block[found_rows, found_cols] = self._values[data_type][rows[found_rows], cols[found_cols]]
+        return block
+    
+    @staticmethod
+    def _as_float_array(df: pd.DataFrame) -> np.ndarray:
+        """Convert a statement to a float array, with missing values as NaN."""
+        if df is None:
+            return None
+        return df.to_numpy(dtype=float, na_value=np.nan)
+    
+    @staticmethod
+    def calculate_growth_rates(start_values: np.ndarray, end_values: np.ndarray) -> np.ndarray:
+        """
+        Calculate growth rates element-wise, as in calculate_growth_rate.
+        
+        Args:
+            start_values: Starting values
+            end_values: Ending values
             
-            # Check for invalid values
-            if pd.isna(value) or np.isinf(value):
-                return 'N/A'
+        Returns:
+            Growth rates as percentages; NaN or inf where not computable
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return (end_values - start_values) / np.abs(start_values) * 100.0
+    
+    @staticmethod
+    def calculate_enterprise_values(market_cap: np.ndarray, total_debt: np.ndarray,
+                                    cash_and_equivalents: np.ndarray) -> np.ndarray:
+        """
+        Calculate Enterprise Value element-wise, as in calculate_enterprise_value.
+        
+        Args:
+            market_cap: Market capitalizations
+            total_debt: Total debt values
+            cash_and_equivalents: Cash and equivalents values
             
-            return value
+        Returns:
+            Enterprise values; NaN where any input is missing
+        """
+        return market_cap + total_debt - cash_and_equivalents
+    
+    @staticmethod
+    def calculate_peg_ratios(pe_ratio: np.ndarray, eps_growth_direct: np.ndarray,
+                             eps_growth_calculated: np.ndarray) -> np.ndarray:
+        """
+        Calculate PEG ratios element-wise, preferring reported EPS growth over calculated growth.
+        
+        Args:
+            pe_ratio: PE ratios
+            eps_growth_direct: EPS growth as reported in the ratios statement
+            eps_growth_calculated: EPS growth calculated from basic EPS
             
-        except (KeyError, IndexError, TypeError):
-            return 'N/A'
+        Returns:
+            PEG ratios; NaN where neither growth is finite and non-zero
+        """
+        # Either growth is only usable when finite and non-zero; a zero start EPS
+        # gives an infinite calculated growth, which must not turn into a PEG of 0
+        use_direct = np.isfinite(eps_growth_direct) & (eps_growth_direct != 0)
+        use_calculated = np.isfinite(eps_growth_calculated) & (eps_growth_calculated != 0)
+        eps_growth = np.where(
+            use_direct, eps_growth_direct, np.where(use_calculated, eps_growth_calculated, np.nan)
+        )
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return pe_ratio / eps_growth
+    
+    @staticmethod
+    def to_metric_value(value: float) -> float:
+        """Return value, or NaN if it is NaN or infinite."""
+        return value if np.isfinite(value) else np.nan
     
     def get_available_years(self, data_type: str) -> list:
         """
@@ -142,22 +190,11 @@ class FinancialCalculator:
             data_type: Type of data ('income', 'balance_sheet', 'cash_flow', 'ratios')
             
         Returns:
-            List of available years as strings
+            Sorted list of available fiscal years
         """
-        data_map = {
-            'income': self.income_data,
-            'balance_sheet': self.balance_sheet_data,
-            'cash_flow': self.cash_flow_data,
-            'ratios': self.ratios_data
-        }
-        
-        df = data_map.get(data_type)
-        if df is None:
-            return []
-        
-        return sorted(df.index.strftime('%Y-%m-%d').tolist())
+        return list(self._available_years.get(data_type, []))
     
-    def validate_data_availability(self, year: str, data_type: str, metric: str) -> bool:
+    def validate_data_availability(self, year: int, data_type: str, metric: str) -> bool:
         """
         Check if data is available for a specific year, data type, and metric.
         
@@ -169,5 +206,4 @@ class FinancialCalculator:
         Returns:
             True if data is available and valid, False otherwise
         """
-        value = self.get_metric_value(year, data_type, metric)
-        return value != 'N/A' and value is not None
\ No newline at end of file
+        return bool(np.isfinite(self.get_metric_value(year, data_type, metric)))
\ No newline at end of file
@@ -2,85 +2,258 @@
 Module for loading and preprocessing financial data from CSV files.
 """
 
+import hashlib
+import logging
+import os
+import numpy as np
 import pandas as pd
-from typing import Dict, List
+from typing import Dict, FrozenSet, Iterable, List, Optional
 from pathlib import Path
+from openpyxl import load_workbook
+
+
+logger = logging.getLogger(__name__)
+
+# Bump when the preprocessed DataFrame layout changes so stale cache entries are ignored
+CACHE_FORMAT_VERSION = 3
+
+# Column headers known not to be fiscal year dates (trailing twelve months); dropped silently
+NON_DATE_HEADERS = frozenset({'TTM'})
 
 
 class FinancialDataLoader:
     """Handles loading and preprocessing of financial data from Excel files."""
     
-    def __init__(self, data_directory: str = "data"):
+    def __init__(self, data_directory: str = "data", cache_directory: Optional[str] = ".cache"):
         """
         Initialize the data loader.
         
         Args:
             data_directory: Path to directory containing Excel files
+            cache_directory: Directory for parsed sheets cached between runs, relative to
+                data_directory unless absolute (None disables caching)
         """
         self.data_directory = Path(data_directory)
+        self._data_dir_str = os.fspath(self.data_directory)
+        # Kept beside the workbooks, so the cache doesn't depend on the working directory
+        self.cache_directory = None if cache_directory is None else self.data_directory / cache_directory
         self.data: Dict[str, pd.DataFrame] = {}
     
-    def load_financial_data(self, sheet_mapping: Dict[str, str], excel_file: str) -> Dict[str, pd.DataFrame]:
+    def load_financial_data(self, sheet_mapping: Dict[str, str], excel_file: str,
+                            metrics: Optional[Dict[str, Iterable[str]]] = None) -> Dict[str, pd.DataFrame]:
         """
         Load financial data from Excel file sheets.
         
         Args:
             sheet_mapping: Dictionary mapping data types to sheet names
             excel_file: Name of the Excel file to read from
+            metrics: Optional dictionary mapping data types to the metric rows to keep;
+                other rows of those sheets are skipped while reading
             
         Returns:
             Dictionary of loaded and processed DataFrames
         """
-        file_path = self.data_directory / excel_file
+        # Drop the previous file's frames rather than mixing them into this load
+        self.data = {}
+        file_path = os.path.join(self._data_dir_str, excel_file)
+        workbook = None  # opened only when the parsed sheets are not cached
         
         try:
-            # Load all sheets at once for efficiency
-            all_sheets = pd.read_excel(file_path, sheet_name=list(sheet_mapping.values()))
+            mtime = os.path.getmtime(file_path)
+            metrics = {} if metrics is None else {
+                data_type: frozenset(names) for data_type, names in metrics.items()
+            }
+            cache_path = self._cache_path(file_path, mtime, sheet_mapping, metrics)
+            loaded = self._read_cache(cache_path)
+            
+            if loaded is None:
+                # Read-only mode streams the sheets; cached values, no external links
+                workbook = load_workbook(file_path, read_only=True, data_only=True, keep_links=False)
+                loaded = {}
+                for data_type, sheet_name in sheet_mapping.items():
+                    if sheet_name not in workbook.sheetnames:
+                        raise ValueError(f"Worksheet named '{sheet_name}' not found")
+                    df = self._read_sheet(workbook[sheet_name], metrics.get(data_type))
+                    loaded[data_type] = self._preprocess_dataframe(df)
+                self._write_cache(cache_path, loaded)
             
             for data_type, sheet_name in sheet_mapping.items():
-                df = all_sheets[sheet_name]
-                self.data[data_type] = self._preprocess_dataframe(df)
-                print(f"✓ Loaded {data_type} data from sheet '{sheet_name}'")
+                self.data[data_type] = loaded[data_type]
+                logger.info(f"✓ Loaded {data_type} data from sheet '{sheet_name}'")
                 
         except FileNotFoundError:
-            print(f"✗ Error: File {excel_file} not found in {self.data_directory}")
+            logger.error(f"✗ Error: File {excel_file} not found in {self.data_directory}")
             raise
         except ValueError as e:
             if "Worksheet" in str(e):
-                print(f"✗ Error: One or more sheets not found in {excel_file}. Available sheets: {pd.ExcelFile(file_path).sheet_names}")
+                logger.error(f"✗ Error: One or more sheets not found in {excel_file}. Available sheets: {workbook.sheetnames}")
             else:
-                print(f"✗ Error reading {excel_file}: {e}")
+                logger.error(f"✗ Error reading {excel_file}: {e}")
             raise
         except Exception as e:
-            print(f"✗ Error loading {excel_file}: {e}")
+            logger.error(f"✗ Error loading {excel_file}: {e}")
             raise
+        finally:
+            # Read-only workbooks hold the file open (and locked on Windows) until closed
+            if workbook is not None:
+                workbook.close()
         
         return self.data
     
-    def _preprocess_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _cache_path(self, file_path: str, mtime: float, sheet_mapping: Dict[str, str],
+                    metrics: Dict[str, FrozenSet[str]]) -> Optional[str]:
         """
-        Preprocess DataFrame by transposing and converting to numeric.
+        Get the cache file for the parsed sheets of a workbook.
+        
+        The key includes the workbook's modification time, so editing the
+        workbook invalidates its cached sheets. File names start with a hash of
+        the workbook path alone, so older entries for the workbook can be found.
         
         Args:
-            df: Raw DataFrame from Excel sheet
+            file_path: Path to the Excel file
+            mtime: Modification time of the Excel file
+            sheet_mapping: Dictionary mapping data types to sheet names
+            metrics: Dictionary mapping data types to the metric rows kept
             
         Returns:
-            Processed DataFrame with datetime index
+            Path of the cache file, or None if caching is disabled
         """
-        # Transpose so years are columns and metrics are rows
-        df = df.transpose()
-        df.columns = df.iloc[0]
-        df = df.iloc[1:]
+        if self.cache_directory is None:
+            return None
+        workbook = os.path.abspath(file_path)
+        mapping = sorted(sheet_mapping.items())
+        kept = sorted((data_type, sorted(names)) for data_type, names in metrics.items())
+        key = f"{CACHE_FORMAT_VERSION}:{workbook}:{mtime}:{mapping}:{kept}"
+        prefix = hashlib.blake2b(workbook.encode(), digest_size=8).hexdigest()
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return os.path.join(self.cache_directory, f"{prefix}-{digest}.pkl")
+    
+    def _read_cache(self, cache_path: Optional[str]) -> Optional[Dict[str, pd.DataFrame]]:
+        """Load cached parsed sheets, or return None if they are not cached or unreadable."""
+        if cache_path is None or not os.path.exists(cache_path):
+            return None
+        try:
+            return pd.read_pickle(cache_path)
+        except Exception:
+            return None
     
-        #Convert columns to numeric
-        for col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
+    def _write_cache(self, cache_path: Optional[str], data: Dict[str, pd.DataFrame]) -> None:
+        """Store parsed sheets in the cache; failures only cost the cache entry."""
+        if cache_path is None:
+            return
+        # Write to a temporary file first so readers never see a partial entry
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.cache_directory, exist_ok=True)
+            pd.to_pickle(data, temp_path)
+            os.replace(temp_path, cache_path)
+        except Exception:
+            # Don't leave a partial temporary file behind for every failed write
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return
+        
+        try:
+            # Keep one entry per workbook: drop those from older versions or mappings
+            prefix = os.path.basename(cache_path).split('-', 1)[0] + '-'
+            with os.scandir(self.cache_directory) as entries:
+                for entry in entries:
+                    if (entry.name.startswith(prefix) and entry.name.endswith('.pkl')
+                            and entry.path != cache_path):
+                        os.remove(entry.path)
+        except OSError:
+            pass
+    
+    def _read_sheet(self, worksheet, metrics: Optional[FrozenSet[str]] = None) -> pd.DataFrame:
+        """
+        Build a DataFrame from a read-only worksheet.
+        
+        Args:
+            worksheet: openpyxl worksheet opened in read-only mode
+            metrics: Optional set of metric names (first-column values) to keep
+            
+        Returns:
+            Raw DataFrame with one row per date column of the sheet and one
+            column per metric row, named from the sheet's first column
+        """
+        # Skip blank rows that read-only mode reports past the end of the data
+        rows = (row for row in worksheet.iter_rows(values_only=True)
+                if any(value is not None for value in row))
+        header = next(rows, None)
+        if header is None:
+            return pd.DataFrame()
+        if metrics is not None:
+            rows = (row for row in rows if row[0] in metrics)
         
-        # Set datetime index
-        df.index = pd.to_datetime(df.index)
+        # Read-only mode doesn't pad rows when the sheet's dimension is missing or
+        # wrong, so fit every row to the header width
+        width = len(header)
+        values = np.array(
+            [(row + (None,) * (width - len(row)))[:width] for row in rows], dtype=object
+        ).reshape(-1, width)
+        
+        # Build the frame already oriented with dates as rows, skipping
+        # trailing columns without a header
+        dates = [i for i, date in enumerate(header) if i > 0 and date is not None]
+        return pd.DataFrame(
+            values[:, dates].T,
+            index=[header[i] for i in dates],
+            columns=pd.Index(values[:, 0], dtype=object)
+        )
+    
+    def _preprocess_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Preprocess DataFrame by converting to numeric and indexing by fiscal year.
+        
+        Args:
+            df: Raw DataFrame from _read_sheet, with dates as rows
+            
+        Returns:
+            Processed DataFrame indexed by fiscal year
+        """
+        # Convert all columns to numeric in one call
+        df = df.apply(pd.to_numeric, errors='coerce')
+        
+        # Index rows by fiscal year as plain integers, keeping the first entry per year.
+        # Headers read as real Excel dates need no parsing.
+        dates = df.index
+        if not isinstance(dates, pd.DatetimeIndex):
+            dates = self._parse_date_headers(dates)
+        df = df[dates.notna()]
+        df.index = dates[dates.notna()].year.astype('int32')
+        df = df[~df.index.duplicated()]
         
         return df
     
+    def _parse_date_headers(self, headers: pd.Index) -> pd.DatetimeIndex:
+        """
+        Parse date column headers, mapping headers that aren't dates to NaT.
+        
+        Args:
+            headers: Date column headers read from a sheet
+            
+        Returns:
+            Parsed dates, NaT where a header is not a date
+        """
+        dates = pd.to_datetime(headers, format='%Y-%m-%d', exact=False, errors='coerce')
+        
+        # Headers in another date format (e.g. 'Sep 30, 2023') fall back to parsing one by one
+        retry = dates.isna() & headers.notna() & ~headers.isin(NON_DATE_HEADERS)
+        if not retry.any():
+            return dates
+        parsed = list(dates)
+        for i in retry.nonzero()[0]:
+            parsed[i] = pd.to_datetime(str(headers[i]), errors='coerce')
+        dates = pd.DatetimeIndex(parsed)
+        
+        # A header that still isn't a date drops its whole column, so say which
+        dropped = [str(header) for header, date, retried in zip(headers, dates, retry) if retried and pd.isna(date)]
+        if dropped:
+            logger.warning(f"Warning: Skipping columns whose header is not a date: {', '.join(dropped)}")
+        return dates
+    
     def get_data(self, data_type: str) -> pd.DataFrame:
         """Get specific financial data type."""
         if data_type not in self.data:
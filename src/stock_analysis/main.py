@@ -2,10 +2,32 @@
 Main script to run stock analysis.
 """
 
+import logging
 import sys
 import os
+from functools import lru_cache
 from pathlib import Path
-from stock_analysis import StockAnalyzer
+from types import MappingProxyType
+
+# StockAnalyzer is imported where it is used, so the interactive menu and
+# argument errors don't wait on pandas and the Excel libraries loading
+
+# Sheet names of each statement in the financials workbooks
+_SHEET_MAPPING = MappingProxyType({
+    'income': 'Income-Annual',
+    'balance_sheet': 'Balance-Sheet-Annual',
+    'cash_flow': 'Cash-Flow-Annual',
+    'ratios': 'Ratios-Annual'
+})
+
+_OUTPUT_DIR = "output"
+
+# Batches up to this size print each ticker's full analysis from the command line
+_VERBOSE_BATCH_LIMIT = 3
+
+# Status messages go through the package logger (see STOCK_ANALYSIS_LOG_LEVEL);
+# named explicitly because __name__ is "__main__" when run with -m
+logger = logging.getLogger("stock_analysis.main")
 
 def main():
     """Main function to run stock analysis."""
@@ -20,120 +42,140 @@ def main():
         print("Error: No ticker symbol provided.")
         return 1
     
-    # Create output directory
-    output_dir = Path("output")
-    output_dir.mkdir(exist_ok=True)
+    # Fail fast on a missing data file, before loading the analysis libraries
+    if not _data_file_exists(ticker, "data"):
+        logger.error(f"Error: No financial data file found for ticker {ticker}")
+        logger.error(f"Make sure the file '{ticker.lower()}-financials.xlsx' exists in the data folder.")
+        return 1
     
-    # Define sheet mapping for Excel file
-    sheet_mapping = {
-        'income': 'Income-Annual',
-        'balance_sheet': 'Balance-Sheet-Annual',
-        'cash_flow': 'Cash-Flow-Annual',
-        'ratios': 'Ratios-Annual'
-    }
+    # Create output directory
+    os.makedirs(_OUTPUT_DIR, exist_ok=True)
     
     # Initialize analyzer
-    analyzer = StockAnalyzer(data_directory="data")
+    analyzer = _get_analyzer("data")
     
     try:
         # Load data for the specified ticker
-        print(f"Loading financial data for {ticker.upper()}...")
-        analyzer.load_data(ticker, sheet_mapping)
+        logger.info(f"Loading financial data for {ticker.upper()}...")
+        analyzer.load_data(ticker, _SHEET_MAPPING)
         
         # Perform analysis
-        print("\nPerforming stock analysis...")
-        results = analyzer.analyze_stock()
+        logger.info("\nPerforming stock analysis...")
+        analyzer.analyze_stock()
         
         # Print results to console
         print("\n")
         analyzer.print_analysis()
         
         # Export results to Excel in output folder
-        print("\nExporting results to Excel...")
-        output_file = output_dir / f"{ticker.lower()}-result.xlsx"
-        analyzer.export_to_excel(str(output_file))
+        logger.info("\nExporting results to Excel...")
+        output_file = os.path.join(_OUTPUT_DIR, f"{ticker.lower()}-result.xlsx")
+        analyzer.export_to_excel(output_file)
         
-        print(f"\nAnalysis complete for {ticker.upper()}!")
-        print(f"Results saved to: {output_file}")
+        logger.info(f"\nAnalysis complete for {ticker.upper()}!")
+        logger.info(f"Results saved to: {output_file}")
         
     except FileNotFoundError as e:
-        print(f"Error: {e}")
-        print(f"Make sure the file '{ticker.lower()}-financials.xlsx' exists in the data folder.")
+        logger.error(f"Error: {e}")
+        logger.error(f"Make sure the file '{ticker.lower()}-financials.xlsx' exists in the data folder.")
         return 1
     except Exception as e:
-        print(f"Error during analysis: {e}")
+        logger.error(f"Error during analysis: {e}")
         return 1
     
     return 0
 
-def analyze_multiple_tickers(tickers: list):
+@lru_cache(maxsize=4)
+def _get_analyzer(data_directory: str):
+    """
+    Get the analyzer for a data directory, creating it on first use.
+    
+    The analyzer is shared by every analysis in this process, so its data
+    directory listing is reused. load_data replaces all per-ticker state, so
+    reuse across tickers is safe.
+    
+    Args:
+        data_directory: Path to directory containing Excel files
+        
+    Returns:
+        StockAnalyzer for the directory
+    """
+    from stock_analysis import StockAnalyzer
+    return StockAnalyzer(data_directory=data_directory)
+
+def _data_file_exists(ticker: str, data_directory: str) -> bool:
+    """
+    Check whether a ticker has a financials workbook, matching the name case-insensitively.
+    
+    Args:
+        ticker: Stock ticker symbol
+        data_directory: Path to directory containing Excel files
+        
+    Returns:
+        True if the data file exists, False otherwise
+    """
+    filename = f"{ticker.lower()}-financials.xlsx"
+    if os.path.isfile(os.path.join(data_directory, filename)):
+        return True
+    try:
+        with os.scandir(data_directory) as entries:
+            return any(entry.name.lower() == filename for entry in entries)
+    except FileNotFoundError:
+        return False
+
+def analyze_multiple_tickers(tickers: list, verbose: bool = False):
     """
     Analyze multiple tickers in batch and export to single Excel file.
     
     Args:
         tickers: List of ticker symbols to analyze
+        verbose: Print each ticker's full analysis; off by default since the
+            Excel export has it all
     """
     # Create output directory
-    output_dir = Path("output")
-    output_dir.mkdir(exist_ok=True)
+    os.makedirs(_OUTPUT_DIR, exist_ok=True)
     
-    sheet_mapping = {
-        'income': 'Income-Annual',
-        'balance_sheet': 'Balance-Sheet-Annual',
-        'cash_flow': 'Cash-Flow-Annual',
-        'ratios': 'Ratios-Annual'
-    }
-    
-    analyzer = StockAnalyzer(data_directory="data")
+    analyzer = _get_analyzer("data")
     
     successful_analyses = []
     failed_analyses = []
     batch_results = []  # Store all results for batch export
     
-    for ticker in tickers:
-        print(f"\n{'='*60}")
-        print(f"Analyzing {ticker.upper()}...")
-        print('='*60)
-        
-        try:
-            # Load data for the current ticker
-            analyzer.load_data(ticker, sheet_mapping)
-            
-            # Perform analysis
-            results = analyzer.analyze_stock()
-            
-            # Print results to console
-            analyzer.print_analysis()
-            
-            # Store results for batch export (make a copy)
-            batch_results.append(analyzer.results.copy())
-            
-            successful_analyses.append(ticker.upper())
-            print(f"✓ Analysis complete for {ticker.upper()}!")
-            
-        except Exception as e:
+    # Tickers are loaded and analyzed in parallel worker processes;
+    # results come back in ticker order for printing and export
+    for ticker, (results, error) in zip(tickers, analyzer.analyze_tickers(tickers, _SHEET_MAPPING)):
+        if error is not None:
             failed_analyses.append(ticker.upper())
             batch_results.append(None)  # Add None for failed analysis
-            print(f"✗ Error analyzing {ticker.upper()}: {e}")
+            logger.error(f"✗ Error analyzing {ticker.upper()}: {error}")
+            continue
+        
+        # Print results to console
+        if verbose:
+            print()
+            analyzer.print_analysis(results)
+        
+        # Store results for batch export (each analysis returns a new result)
+        batch_results.append(results)
+        
+        successful_analyses.append(ticker.upper())
+        logger.info(f"✓ Analysis complete for {ticker.upper()}!")
     
     # Export all results to a single Excel file
     if batch_results and any(result is not None for result in batch_results):
-        print(f"\n{'='*60}")
-        print("EXPORTING BATCH RESULTS TO EXCEL...")
-        print('='*60)
+        logger.info(f"\n{'='*60}\nEXPORTING BATCH RESULTS TO EXCEL...\n{'='*60}")
         
         try:
             # Create batch filename in output directory
-            batch_filename = f"stock-analysis.xlsx"
-            batch_filepath = output_dir / batch_filename
+            batch_filepath = os.path.join(_OUTPUT_DIR, "stock-analysis.xlsx")
             
             # Export all results to single Excel file
-            analyzer.export_to_excel(str(batch_filepath), batch_results)
+            analyzer.export_to_excel(batch_filepath, batch_results)
             
-            print(f"✓ Batch results exported to: {batch_filepath}")
+            logger.info(f"✓ Batch results exported to: {batch_filepath}")
             
         except Exception as e:
-            print(f"✗ Error exporting batch results: {e}")
+            logger.error(f"✗ Error exporting batch results: {e}")
     
     # Summary
     print(f"\n{'='*60}")
@@ -147,24 +189,25 @@ def analyze_multiple_tickers(tickers: list):
     if failed_analyses:
         print(f"Failed: {', '.join(failed_analyses)}")
     
-    print(f"\nAll output files saved to: {output_dir.absolute()}")
+    print(f"\nAll output files saved to: {os.path.abspath(_OUTPUT_DIR)}")
+
 def analyze_from_file(filename: str):
     """
-    Analyze tickers from a text file (one ticker per line).
+    Analyze tickers from a text file (one ticker per line, or separated by whitespace).
     
     Args:
         filename: Path to file containing ticker symbols
     """
     try:
-        with open(filename, 'r') as f:
-            tickers = [line.strip().upper() for line in f if line.strip()]
+        # One upper() and split() over the whole file also drops blank lines
+        tickers = Path(filename).read_text().upper().split()
         
         if not tickers:
             print(f"No tickers found in {filename}")
             return
         
         print(f"Found {len(tickers)} tickers in {filename}: {', '.join(tickers)}")
-        analyze_multiple_tickers(tickers)
+        analyze_multiple_tickers(tickers, verbose=len(tickers) <= _VERBOSE_BATCH_LIMIT)
         
     except FileNotFoundError:
         print(f"Error: File '{filename}' not found.")
@@ -173,7 +216,7 @@ def analyze_from_file(filename: str):
 
 def create_output_directory_structure():
     """Create organized output directory structure."""
-    output_dir = Path("output")
+    output_dir = Path(_OUTPUT_DIR)
     output_dir.mkdir(exist_ok=True)
     
     # Create subdirectories for better organization
@@ -187,7 +230,7 @@ if __name__ == "__main__":
     if len(sys.argv) > 2:
         # Batch mode - analyze multiple tickers
         tickers = sys.argv[1:]
-        analyze_multiple_tickers(tickers)
+        analyze_multiple_tickers(tickers, verbose=len(tickers) <= _VERBOSE_BATCH_LIMIT)
     elif len(sys.argv) == 2:
         # Check if it's a file with .txt extension
         if sys.argv[1].endswith('.txt'):
@@ -211,7 +254,7 @@ if __name__ == "__main__":
             ticker_input = input("Enter tickers separated by spaces: ").strip()
             if ticker_input:
                 tickers = ticker_input.split()
-                analyze_multiple_tickers(tickers)
+                analyze_multiple_tickers(tickers, verbose=len(tickers) <= _VERBOSE_BATCH_LIMIT)
             else:
                 print("No tickers provided.")
         elif choice == "3":
@@ -0,0 +1,59 @@
+"""
+Result types returned by the stock analysis.
+"""
+
+from dataclasses import dataclass
+
+
+# Classes declare __slots__ by hand (dataclass(slots=True) needs Python 3.10),
+# so each result stores its fields without a per-instance __dict__
+
+
+@dataclass
+class AnalysisPeriod:
+    """Fiscal years the analysis compares."""
+    __slots__ = ('start_year', 'end_year')
+    start_year: int
+    end_year: int
+
+
+@dataclass
+class MetricGrowth:
+    """A metric's value at the start and end of the period and its growth in percent."""
+    __slots__ = ('start_value', 'end_value', 'growth_rate')
+    start_value: float
+    end_value: float
+    growth_rate: float
+
+
+@dataclass
+class Ratios:
+    """Valuation ratios for the end year."""
+    __slots__ = ('pe_ratio', 'peg_ratio')
+    pe_ratio: float
+    peg_ratio: float
+
+
+@dataclass
+class Values:
+    """Enterprise value components and gross profit for the end year."""
+    __slots__ = ('market_cap', 'total_debt', 'cash_and_equivalents', 'enterprise_value', 'gross_profit')
+    market_cap: float
+    total_debt: float
+    cash_and_equivalents: float
+    enterprise_value: float
+    gross_profit: float
+
+
+@dataclass
+class AnalysisResult:
+    """Complete analysis of one ticker; missing values are NaN."""
+    __slots__ = ('ticker', 'analysis_period', 'revenue', 'net_income',
+                 'free_cash_flow_per_share', 'ratios', 'values')
+    ticker: str
+    analysis_period: AnalysisPeriod
+    revenue: MetricGrowth
+    net_income: MetricGrowth
+    free_cash_flow_per_share: MetricGrowth
+    ratios: Ratios
+    values: Values
@@ -0,0 +1,39 @@
+"""
+Tests for the financial calculator.
+"""
+
+import numpy as np
+import pandas as pd
+
+from stock_analysis.calculator import FinancialCalculator
+
+
+def _calculator(income: dict, ratios: dict) -> FinancialCalculator:
+    """Build a calculator from per-metric {year: value} mappings."""
+    return FinancialCalculator({
+        'income': pd.DataFrame(income),
+        'ratios': pd.DataFrame(ratios),
+    })
+
+
+def test_peg_ratio_is_nan_when_calculated_eps_growth_is_infinite():
+    # EPS (Basic) 0 -> 2 gives an infinite calculated growth; with no reported
+    # EPS Growth the PEG is not computable rather than PE / inf == 0
+    calculator = _calculator(
+        {'EPS (Basic)': {2019: 0.0, 2024: 2.0}},
+        {'PE Ratio': {2024: 20.0}, 'EPS Growth': {2024: np.nan}},
+    )
+    block = calculator.get_metrics_block([2019, 2024], 'income', ['EPS (Basic)'])
+    growth = calculator.calculate_growth_rates(block[0, 0], block[1, 0])
+    
+    peg = calculator.calculate_peg_ratios(20.0, np.nan, growth)
+    
+    assert np.isinf(growth)
+    assert np.isnan(calculator.to_metric_value(peg))
+
+
+def test_peg_ratio_prefers_reported_eps_growth():
+    assert FinancialCalculator.calculate_peg_ratios(20.0, 10.0, 5.0) == 2.0
+    assert FinancialCalculator.calculate_peg_ratios(20.0, 0.0, 5.0) == 4.0
+    assert FinancialCalculator.calculate_peg_ratios(20.0, np.nan, 5.0) == 4.0
+    assert np.isnan(FinancialCalculator.calculate_peg_ratios(20.0, np.nan, 0.0))
@@ -0,0 +1,136 @@
+"""
+Tests for the financial data loader.
+"""
+
+import logging
+import os
+from datetime import datetime
+
+import pandas as pd
+from openpyxl import Workbook
+
+from stock_analysis.data_loader import FinancialDataLoader
+
+
+def _raw_sheet(headers: list) -> pd.DataFrame:
+    """Build a raw sheet frame as _read_sheet does, with one Revenue value per date header."""
+    return pd.DataFrame({'Revenue': [100 + i for i in range(len(headers))]}, index=headers)
+
+
+def test_non_iso_date_headers_are_parsed(tmp_path):
+    loader = FinancialDataLoader(tmp_path)
+    
+    df = loader._preprocess_dataframe(_raw_sheet(['2024-09-28', 'Sep 30, 2023', '30 Sep 2022']))
+    
+    assert df.index.tolist() == [2024, 2023, 2022]
+    assert df['Revenue'].tolist() == [100, 101, 102]
+
+
+def test_ttm_header_is_dropped_silently(tmp_path, caplog):
+    loader = FinancialDataLoader(tmp_path)
+    
+    with caplog.at_level(logging.WARNING, logger='stock_analysis'):
+        df = loader._preprocess_dataframe(_raw_sheet(['TTM', '2024-09-28', 'Sep 30, 2023']))
+    
+    assert df.index.tolist() == [2024, 2023]
+    assert not caplog.records
+
+
+def test_unknown_header_is_logged_and_dropped(tmp_path, caplog):
+    loader = FinancialDataLoader(tmp_path)
+    
+    with caplog.at_level(logging.WARNING, logger='stock_analysis'):
+        df = loader._preprocess_dataframe(_raw_sheet(['2024-09-28', 'Restated', 'TTM']))
+    
+    assert df.index.tolist() == [2024]
+    assert len(caplog.records) == 1
+    assert 'Restated' in caplog.records[0].getMessage()
+    assert 'TTM' not in caplog.records[0].getMessage()
+
+
+def test_datetime_headers_skip_parsing(tmp_path, monkeypatch):
+    loader = FinancialDataLoader(tmp_path)
+    
+    def fail(headers):
+        raise AssertionError("datetime headers should not be parsed")
+    
+    monkeypatch.setattr(loader, '_parse_date_headers', fail)
+    df = loader._preprocess_dataframe(_raw_sheet([datetime(2024, 9, 28), datetime(2023, 9, 30)]))
+    
+    assert df.index.tolist() == [2024, 2023]
+    assert str(df.index.dtype) == 'int32'
+
+
+class _Worksheet:
+    """Stand-in for a read-only worksheet that yields the given rows as-is."""
+    
+    def __init__(self, rows: list):
+        self.rows = rows
+    
+    def iter_rows(self, values_only: bool = False):
+        assert values_only
+        return iter(self.rows)
+
+
+def test_read_sheet_fits_short_and_long_rows_to_the_header(tmp_path):
+    loader = FinancialDataLoader(tmp_path)
+    worksheet = _Worksheet([
+        ('Metric', '2024-09-28', '2023-09-30', '2022-09-24'),
+        ('Revenue', 391.0, 383.3, 394.3),
+        ('Net Income', 93.7),
+        ('EPS (Basic)', 6.11, 6.16, 6.15, 'stray', None),
+        (None, None, None),
+    ])
+    
+    df = loader._read_sheet(worksheet)
+    
+    assert df.shape == (3, 3)
+    assert df.index.tolist() == ['2024-09-28', '2023-09-30', '2022-09-24']
+    assert df.columns.tolist() == ['Revenue', 'Net Income', 'EPS (Basic)']
+    assert df['Revenue'].tolist() == [391.0, 383.3, 394.3]
+    assert df['Net Income'].tolist() == [93.7, None, None]
+    assert df['EPS (Basic)'].tolist() == [6.11, 6.16, 6.15]
+
+
+def _save_workbook(path, revenue: list) -> None:
+    """Write a one-sheet workbook with Revenue for fiscal 2024 and 2023."""
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = 'Income-Annual'
+    sheet.append(['Metric', '2024-09-28', '2023-09-30'])
+    sheet.append(['Revenue'] + revenue)
+    workbook.save(path)
+
+
+def test_edited_workbook_is_reparsed_and_keeps_one_cache_entry(tmp_path):
+    workbook_path = tmp_path / 'test-financials.xlsx'
+    _save_workbook(workbook_path, [391.0, 383.3])
+    loader = FinancialDataLoader(tmp_path)
+    mapping = {'income': 'Income-Annual'}
+    
+    first = loader.load_financial_data(mapping, workbook_path.name)['income']
+    # Edit the workbook; bump the mtime explicitly in case the clock is coarse
+    _save_workbook(workbook_path, [400.0, 383.3])
+    mtime = os.path.getmtime(workbook_path) + 10
+    os.utime(workbook_path, (mtime, mtime))
+    second = loader.load_financial_data(mapping, workbook_path.name)['income']
+    
+    assert first.loc[2024, 'Revenue'] == 391.0
+    assert second.loc[2024, 'Revenue'] == 400.0
+    assert len(list((tmp_path / '.cache').glob('*.pkl'))) == 1
+    assert FinancialDataLoader(tmp_path).load_financial_data(mapping, workbook_path.name)['income'].equals(second)
+
+
+def test_failed_cache_write_leaves_no_temporary_file(tmp_path, monkeypatch):
+    loader = FinancialDataLoader(tmp_path)
+    cache_path = str(tmp_path / '.cache' / 'entry.pkl')
+    
+    def fail_partway(data, path):
+        with open(path, 'wb') as f:
+            f.write(b'partial')
+        raise RuntimeError("disk full")
+    
+    monkeypatch.setattr(pd, 'to_pickle', fail_partway)
+    loader._write_cache(cache_path, {})
+    
+    assert os.listdir(tmp_path / '.cache') == []